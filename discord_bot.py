@@ -3,10 +3,10 @@ from discord.ext import commands
 import asyncio
 import logging
 from config import BOT_TOKEN, BOT_PREFIX, BOT_DESCRIPTION
-from google_sheet_service import goole_sheet_service
+from google_sheet_service import get_sheet_service
 from sheet_structures import SheetType
-import random
-import string
+import os
+import base64
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('discord_bot')
@@ -19,29 +19,96 @@ intents.guilds = True
 # Create bot instance
 bot = commands.Bot(command_prefix=BOT_PREFIX, description=BOT_DESCRIPTION, intents=intents)
 
+# Queue of pending sheet inserts, flushed in batches by a background task so
+# bursts of new threads share one API call instead of one write each
+pending_inserts: asyncio.Queue = asyncio.Queue()
+FLUSH_INTERVAL_SECONDS = 2
+FLUSH_BATCH_SIZE = 100
+
+# The bot's own user id, cached in on_ready for a cheap guard in on_message
+_bot_user_id = None
+
+# Static welcome message sent to every new thread
+WELCOME_MESSAGE = "Welcome to the thread! I'm here to help. Send any message and I'll respond with static text."
+
+def _generate_id(prefix):
+    """Generate a short random record id like PETX3K9QA.
+
+    One urandom read beats sampling characters in a Python loop, and OS
+    entropy avoids collisions under concurrent use.
+    """
+    return prefix + base64.b32encode(os.urandom(4))[:6].decode('ascii')
+
+def _insert_thread_records(records):
+    """Insert queued thread records; runs in a worker thread."""
+    return get_sheet_service().insert_records(SheetType.PETS, records)
+
+async def flush_pending_inserts():
+    """Background task that drains queued sheet inserts into batched writes."""
+    while True:
+        await asyncio.sleep(FLUSH_INTERVAL_SECONDS)
+
+        records = []
+        while len(records) < FLUSH_BATCH_SIZE:
+            try:
+                records.append(pending_inserts.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        if not records:
+            continue
+
+        try:
+            # The Sheets client is synchronous (and constructed lazily on the
+            # first flush), so run it in a worker thread to keep the event
+            # loop free while the request is in flight
+            success = await asyncio.to_thread(_insert_thread_records, records)
+            if success:
+                logger.info('Recorded %s threads in Google Sheets', len(records))
+            else:
+                logger.warning('Failed to record %s threads in Google Sheets', len(records))
+        except Exception as e:
+            logger.error('Error recording threads in Google Sheets: %s', e)
+
 @bot.event
 async def on_ready():
     """Event triggered when the bot is ready and connected to Discord."""
-    logger.info(f'{bot.user} has connected to Discord!')
-    logger.info(f'Bot is in {len(bot.guilds)} guilds')
-    
+    global _bot_user_id
+    _bot_user_id = bot.user.id
+
+    logger.info('%s has connected to Discord!', bot.user)
+    logger.info('Bot is in %s guilds', len(bot.guilds))
+
+    # Start the background flush task for queued sheet inserts
+    if not getattr(bot, '_flush_task', None):
+        bot._flush_task = asyncio.create_task(flush_pending_inserts())
+
     # Set bot status
     await bot.change_presence(activity=discord.Game(name="Responding to threads"))
 
 @bot.event
 async def on_message(message):
     """Event triggered when a message is sent in any channel or thread."""
-    # Check if the message is in a thread
-    if isinstance(message.channel, discord.Thread) and not message.author.bot:
-        logger.info(f'Received message in thread "{message.channel.name}": {message.content}')
-        
+    # Fast path: ignore our own messages before any other checks
+    if message.author.id == _bot_user_id:
+        return
+
+    channel = message.channel
+    # Check if the message is in a thread (exact type check is cheaper than
+    # isinstance and threads are never subclassed here)
+    if type(channel) is discord.Thread and not message.author.bot:
+        # Gate explicitly: this line logs full message content on every
+        # thread message, so skip even the logger call when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Received message in thread "%s": %s', channel.name, message.content)
+
         try:
-            await message.channel.send("This is a response from bot.")
-            logger.info(f'Responded to message in thread "{message.channel.name}"')
+            await channel.send("This is a response from bot.")
+            logger.info('Responded to message in thread "%s"', channel.name)
         except Exception as e:
-            logger.error(f'Error responding to message in thread: {e}')
+            logger.error('Error responding to message in thread: %s', e)
     elif not message.author.bot:
-        await message.channel.send("Please start a new thread using /thread command to get started.")
+        await channel.send("Please start a new thread using /thread command to get started.")
 
     # Process commands (if any)
     await bot.process_commands(message)
@@ -49,46 +116,40 @@ async def on_message(message):
 @bot.event
 async def on_thread_create(thread):
     """Event triggered when a new thread is created."""
-    logger.info(f'New thread created: "{thread.name}" in channel "{thread.parent.name}"')
+    logger.info('New thread created: "%s" in channel "%s"', thread.name, thread.parent.name)
 
-    # Attempt to make the thread private (invitable=False, type=private)
     try:
-        # Only proceed if the thread is not already private
-        if not thread.invitable or thread.type == discord.ChannelType.private_thread:
-            logger.info(f'Thread "{thread.name}" is already private.')
-        else:
-            # Only the thread creator and the bot will have access
-            await thread.edit(invitable=False)
-            logger.info(f'Set thread "{thread.name}" to private (invitable=False).')
+        pet_id = _generate_id("PET")
+        await pending_inserts.put({
+            "lead_id": str(thread.id),
+            "pet_id": pet_id,
+            "status": "initiated"
+        })
+        logger.info('Queued thread "%s" for recording in Google Sheets', thread.name)
     except Exception as e:
-        logger.error(f'Error making thread private: {e}')
+        logger.error('Error queueing thread for Google Sheets: %s', e)
 
-    try:
-        pet_id = "PET" + ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
-        success = goole_sheet_service.insert_record(
-            SheetType.PETS,
-            {
-                "lead_id": str(thread.id),
-                "pet_id": pet_id,
-                "status": "initiated"
-            }
-        )
-        
-        if success:
-            logger.info(f'Successfully recorded thread "{thread.name}" in Google Sheets')
-        else:
-            logger.warning(f'Failed to record thread "{thread.name}" in Google Sheets')
-            
-    except Exception as e:
-        logger.error(f'Error recording thread in Google Sheets: {e}')
+    # The privacy edit and welcome message are independent Discord calls,
+    # so run them concurrently instead of awaiting them one after the other
+    steps = []
+
+    # Attempt to make the thread private (invitable=False, type=private)
+    # Only proceed if the thread is not already private
+    if not thread.invitable or thread.type == discord.ChannelType.private_thread:
+        logger.info('Thread "%s" is already private.', thread.name)
+    else:
+        # Only the thread creator and the bot will have access
+        steps.append(('making thread private', thread.edit(invitable=False)))
 
     # Optionally send a welcome message to new threads
-    try:
-        welcome_message = f"Welcome to the thread! I'm here to help. Send any message and I'll respond with static text."
-        await thread.send(welcome_message)
-        logger.info(f'Sent welcome message to new thread "{thread.name}"')
-    except Exception as e:
-        logger.error(f'Error sending welcome message to new thread: {e}')
+    steps.append(('sending welcome message', thread.send(WELCOME_MESSAGE)))
+
+    results = await asyncio.gather(*(coro for _, coro in steps), return_exceptions=True)
+    for (step_name, _), result in zip(steps, results):
+        if isinstance(result, Exception):
+            logger.error('Error %s for thread "%s": %s', step_name, thread.name, result)
+        else:
+            logger.info('Finished %s for thread "%s"', step_name, thread.name)
 
 async def main():
     """Main function to run the bot."""
@@ -98,8 +159,15 @@ async def main():
     except discord.LoginFailure:
         logger.error("Failed to login: Invalid bot token")
     except Exception as e:
-        logger.error(f"Error starting bot: {e}")
+        logger.error("Error starting bot: %s", e)
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop where available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the bot
     asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Shared helpers for the Google API service clients.
+"""
+
+import logging
+import random
+import threading
+import time
+
+logger = logging.getLogger('google_api_utils')
+
+# Transient statuses worth retrying: rate limiting and server-side errors
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_RETRY_ATTEMPTS = 5
+
+_orjson_patch_applied = False
+
+
+def execute_with_retry(request):
+    """
+    Execute a googleapiclient request, retrying transient failures.
+
+    429 and 5xx responses are retried with exponential backoff plus jitter
+    on the already-authenticated client, so a momentary quota blip costs a
+    short sleep instead of a failed operation. Anything else is raised to
+    the caller unchanged.
+    """
+    from googleapiclient.errors import HttpError
+
+    delay = 1.0
+    for attempt in range(1, MAX_RETRY_ATTEMPTS + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            status = e.resp.status if e.resp is not None else None
+            if status not in RETRYABLE_STATUS_CODES or attempt == MAX_RETRY_ATTEMPTS:
+                raise
+
+            wait_time = delay + random.uniform(0, delay)
+            logger.warning("Google API request returned %s; retrying in %.1fs (attempt %s/%s)",
+                           status, wait_time, attempt, MAX_RETRY_ATTEMPTS)
+            time.sleep(wait_time)
+            delay = min(delay * 2, 30)
+
+
+def use_orjson_for_api_payloads():
+    """
+    Swap googleapiclient's response parsing to orjson when it is installed.
+
+    Every execute() parses the response with the stdlib json module; orjson
+    handles the small dicts used here several times faster. Serialization is
+    left on stdlib json.dumps: its ASCII-escaped output survives httplib2
+    handing str bodies to http.client (which encodes them as latin-1),
+    whereas raw UTF-8 from orjson would break on names or notes containing
+    non-latin-1 characters. The patch is scoped to googleapiclient's
+    JsonModel and is a no-op when orjson is not available.
+    """
+    global _orjson_patch_applied
+    if _orjson_patch_applied:
+        return
+
+    try:
+        import orjson
+    except ImportError:
+        return
+
+    from googleapiclient import model
+
+    def deserialize(self, content):
+        body = orjson.loads(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+    model.JsonModel.deserialize = deserialize
+    _orjson_patch_applied = True
+
+
+class TokenBucket:
+    """
+    Simple thread-safe token bucket used to pace Google API requests.
+
+    Google enforces per-minute request quotas (e.g. 60 write requests per
+    minute per user for Sheets). Pacing requests client-side smooths bursts
+    into the allowed rate instead of paying a round trip plus backoff for
+    each 429 response.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last_refill
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
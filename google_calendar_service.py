@@ -7,22 +7,44 @@ import os
 import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
+import httplib2
+from cachetools import TTLCache
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from config import GOOGLE_CALENDAR_CREDENTIALS_FILE
+from google_api_utils import TokenBucket, execute_with_retry, use_orjson_for_api_payloads
+
+# Use orjson for API request/response JSON when it is installed
+use_orjson_for_api_payloads()
 
 logger = logging.getLogger('google_calendar_service')
 
 class GoogleCalendarService:
     def __init__(self):
         self.credentials = None
-        self.service = None
         self.calendar_id = 'primary'
-        self._authenticate()
-    
+        # Pace API calls to stay well inside the Calendar API quota
+        self._rate_limiter = TokenBucket(rate=5, capacity=10)
+        # Cache availability lookups briefly so repeated probes for the same
+        # slot (e.g. a user iterating over suggestions) skip the network call
+        self._availability_cache = TTLCache(maxsize=512, ttl=30)
+        # Authentication is deferred until the first calendar operation so
+        # importing this module does no blocking I/O
+        self._service = None
+        self._auth_attempted = False
+
+    @property
+    def service(self):
+        """Authenticate lazily on first use and return the API client."""
+        if self._service is None and not self._auth_attempted:
+            self._auth_attempted = True
+            self._authenticate()
+        return self._service
+
     def _authenticate(self):
         """Authenticate with Google Calendar API using service account credentials."""
         try:
@@ -47,67 +69,148 @@ class GoogleCalendarService:
                 with open('token.json', 'w') as token:
                     token.write(creds.to_json())
             
-            self.service = build('calendar', 'v3', credentials=creds)
+            # Route all calls through one authorized HTTP object so the
+            # underlying TLS connection is kept alive and reused between
+            # requests instead of a fresh handshake per call
+            authorized_http = AuthorizedHttp(creds, http=httplib2.Http())
+            self._service = build('calendar', 'v3', http=authorized_http,
+                                  cache_discovery=False, static_discovery=True)
             logger.info("Successfully authenticated with Google Calendar API")
             
         except Exception as e:
-            logger.error(f"Failed to authenticate with Google Calendar API: {e}")
+            logger.error("Failed to authenticate with Google Calendar API: %s", e)
     
-    def _check_availability(self, date: str, start_time: str, end_time: str = None) -> Tuple[bool, str]:
+    @staticmethod
+    def _parse_slot(date: str, start_time: str, end_time: str = None) -> Tuple[datetime, datetime]:
+        """
+        Parse a date and time pair into timezone-aware UTC datetimes.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+            start_time: Start time in HH:MM format (24-hour)
+            end_time: End time in HH:MM format (optional, defaults to 1 hour after start_time)
+
+        Returns:
+            Tuple of (start_datetime, end_datetime)
+        """
+        start_datetime = datetime.fromisoformat(f"{date}T{start_time}:00+00:00")
+
+        # If no end_time provided, make it 1 hour after start_time
+        if end_time is None:
+            end_datetime = start_datetime + timedelta(hours=1)
+        else:
+            end_datetime = datetime.fromisoformat(f"{date}T{end_time}:00+00:00")
+
+        return start_datetime, end_datetime
+
+    def _check_availability(self, date: str, start_time: str, end_time: str = None,
+                            slot: Tuple[datetime, datetime] = None) -> Tuple[bool, str]:
         """
         Check if a 1-hour slot is available on the specified date and time.
-        
+
         Args:
             date: Date in YYYY-MM-DD format
             start_time: Start time in HH:MM format (24-hour)
             end_time: End time in HH:MM format (optional, defaults to 1 hour after start_time)
-        
+            slot: Already-parsed (start, end) datetimes, to avoid re-parsing
+
         Returns:
             Tuple of (is_available, conflicting_events)
         """
         if not self.service:
             logger.warning("Google Calendar service not available.")
             return False, "Google Calendar service not available."
-        
+
         try:
-            # Parse date and time
-            start_datetime = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-            
-            # If no end_time provided, make it 1 hour after start_time
-            if end_time is None:
-                end_datetime = start_datetime + timedelta(hours=1)
-            else:
-                end_datetime = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
-            
-            # Convert to RFC3339 format for Google Calendar API
-            time_min = start_datetime.isoformat() + 'Z'
-            time_max = end_datetime.isoformat() + 'Z'
-            
-            # Query for events in the time range
-            events_result = self.service.events().list(
+            # Parse date and time once (callers may pass the parsed slot along)
+            start_datetime, end_datetime = slot or self._parse_slot(date, start_time, end_time)
+
+            # Timezone-aware datetimes format directly to RFC3339
+            time_min = start_datetime.isoformat()
+            time_max = end_datetime.isoformat()
+
+            # Serve repeat probes for the same slot from the cache
+            cache_key = (self.calendar_id, time_min, time_max)
+            cached = self._availability_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # Query for events in the time range; only presence matters, so
+            # ask for at most one event and just its id to keep the response tiny
+            self._rate_limiter.acquire()
+            request = self.service.events().list(
                 calendarId=self.calendar_id,
                 timeMin=time_min,
                 timeMax=time_max,
-            ).execute()
-            
+                maxResults=1,
+                singleEvents=True,
+                fields='items(id)',
+            )
+            events_result = execute_with_retry(request)
+
             events = events_result.get('items', [])
-            
+
             # Check if there are any conflicting events
             if events:
-                logger.info(f"Found {len(events)} conflicting events for {date} {start_time}")
-                return False, "This timeslot is not available"
+                logger.info("Found a conflicting event for %s %s", date, start_time)
+                result = (False, "This timeslot is not available")
             else:
-                logger.info(f"Slot available for {date} {start_time}")
-                return True, "This timeslot is available"
+                logger.info("Slot available for %s %s", date, start_time)
+                result = (True, "This timeslot is available")
+
+            self._availability_cache[cache_key] = result
+            return result
                 
         except HttpError as e:
-            logger.error(f"HTTP error occurred while checking availability: {e}")
+            logger.error("HTTP error occurred while checking availability: %s", e)
             return False, str(e)
         except Exception as e:
-            logger.error(f"Error checking availability: {e}")
+            logger.error("Error checking availability: %s", e)
             return False, str(e)
     
-    def create_appointment(self, 
+    def get_busy_intervals(self, time_min: datetime, time_max: datetime) -> List[Tuple[datetime, datetime]]:
+        """
+        Get the busy intervals on the calendar across a whole time window.
+
+        One freebusy query covers the entire window, so a caller probing
+        many candidate slots can fetch this once and test each slot locally
+        instead of issuing an events query per slot.
+
+        Args:
+            time_min: Start of the window (timezone-aware)
+            time_max: End of the window (timezone-aware)
+
+        Returns:
+            List of (start, end) datetime pairs for busy periods
+        """
+        if not self.service:
+            logger.warning("Google Calendar service not available.")
+            return []
+
+        try:
+            self._rate_limiter.acquire()
+            request = self.service.freebusy().query(body={
+                'timeMin': time_min.isoformat(),
+                'timeMax': time_max.isoformat(),
+                'items': [{'id': self.calendar_id}],
+            })
+            result = execute_with_retry(request)
+
+            busy = result.get('calendars', {}).get(self.calendar_id, {}).get('busy', [])
+            return [
+                (datetime.fromisoformat(interval['start'].replace('Z', '+00:00')),
+                 datetime.fromisoformat(interval['end'].replace('Z', '+00:00')))
+                for interval in busy
+            ]
+
+        except HttpError as e:
+            logger.error("HTTP error occurred while querying busy intervals: %s", e)
+            return []
+        except Exception as e:
+            logger.error("Error querying busy intervals: %s", e)
+            return []
+
+    def create_appointment(self,
                           date: str, 
                           start_time: str, 
                           pet_name: str, 
@@ -135,22 +238,17 @@ class GoogleCalendarService:
             return False, "Google Calendar service not available."
         
         try:
+            # Parse date and time once and reuse it for the availability check
+            start_datetime, end_datetime = self._parse_slot(date, start_time, end_time)
+
             # First check availability
-            is_available, message = self._check_availability(date, start_time, end_time)
-            
+            is_available, message = self._check_availability(
+                date, start_time, end_time, slot=(start_datetime, end_datetime))
+
             if not is_available:
                 logger.warning(message)
                 return False, message
-            
-            # Parse date and time
-            start_datetime = datetime.strptime(f"{date} {start_time}", "%Y-%m-%d %H:%M")
-            
-            # If no end_time provided, make it 1 hour after start_time
-            if end_time is None:
-                end_datetime = start_datetime + timedelta(hours=1)
-            else:
-                end_datetime = datetime.strptime(f"{date} {end_time}", "%Y-%m-%d %H:%M")
-            
+
             # Create event
             event = {
                 'summary': f"{service_type} - {pet_name}",
@@ -173,20 +271,26 @@ class GoogleCalendarService:
             }
             
             # Insert the event
-            event_result = self.service.events().insert(
+            self._rate_limiter.acquire()
+            request = self.service.events().insert(
                 calendarId=self.calendar_id,
                 body=event
-            ).execute()
+            )
+            event_result = execute_with_retry(request)
             
             event_id = event_result.get('id')
-            logger.info(f"Successfully created appointment: {event_id}")
+            logger.info("Successfully created appointment: %s", event_id)
+
+            # The new event may overlap cached windows, so drop any stale
+            # "available" answers
+            self._availability_cache.clear()
             return True, event_id
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while creating appointment: {e}")
+            logger.error("HTTP error occurred while creating appointment: %s", e)
             return False, str(e)
         except Exception as e:
-            logger.error(f"Error creating appointment: {e}")
+            logger.error("Error creating appointment: %s", e)
             return False, str(e) 
     
     def get_appointment_details(self, event_id: str) -> Optional[Dict]:
@@ -204,18 +308,20 @@ class GoogleCalendarService:
             return None
         
         try:
-            event = self.service.events().get(
+            self._rate_limiter.acquire()
+            request = self.service.events().get(
                 calendarId=self.calendar_id,
                 eventId=event_id
-            ).execute()
+            )
+            event = execute_with_retry(request)
             
             return event
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while getting appointment details: {e}")
+            logger.error("HTTP error occurred while getting appointment details: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error getting appointment details: {e}")
+            logger.error("Error getting appointment details: %s", e)
             return None
 
 # Create a global instance
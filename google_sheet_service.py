@@ -4,22 +4,49 @@ This service can work with multiple sheets, each with their own structure.
 """
 
 import os
+import re
 import logging
+import threading
+import httplib2
+from cachetools import TTLCache
 from google.oauth2.service_account import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from typing import Dict, List, Any, Optional
 from config import GOOGLE_SHEETS_CREDENTIALS_FILE, SPREADSHEET_ID
-from sheet_structures import SheetType, get_sheet_structure
+from google_api_utils import TokenBucket, execute_with_retry, use_orjson_for_api_payloads
+from sheet_structures import SheetType, get_sheet_structure, get_full_range, get_field, get_range_prefixes, a1_range
+
+# Use orjson for API request/response JSON when it is installed
+use_orjson_for_api_payloads()
 
 logger = logging.getLogger('multi_sheet_service')
 
+# Cap the rows sent per append so very large batches stay inside the API's
+# request-size limits
+MAX_ROWS_PER_APPEND = 10000
+
 class GoogleSheetsService:
     def __init__(self):
         self.credentials = None
         self.service = None
         self.spreadsheet_id = SPREADSHEET_ID
-        
+        # Pace API calls just under the 60 requests/minute/user quota
+        self._rate_limiter = TokenBucket(rate=55 / 60, capacity=10)
+        # Cache of (sheet_name, record_id) -> row number so updates don't
+        # need a full-sheet read just to locate the row again
+        self._row_index: Dict[tuple, int] = {}
+        # Short-lived cache of fetched records so repeated lookups for the
+        # same record within a minute don't repeat the API read
+        self._record_cache = TTLCache(maxsize=2048, ttl=60)
+        # Short-lived cache of raw value-range reads keyed by (spreadsheet,
+        # range); invalidated per sheet whenever that sheet is written
+        self._read_cache = TTLCache(maxsize=64, ttl=30)
+        self._cache_lock = threading.Lock()
+        # Numeric sheet ids by title, fetched once and reused for metadata
+        self._sheet_ids: Dict[str, int] = {}
+
         if not self.spreadsheet_id:
             logger.warning("Google Spreadsheet ID not configured. Google Sheets integration will be disabled.")
             return
@@ -34,7 +61,7 @@ class GoogleSheetsService:
             
             # Check if credentials file exists
             if not os.path.exists(GOOGLE_SHEETS_CREDENTIALS_FILE):
-                logger.error(f"Google Sheets credentials file not found: {GOOGLE_SHEETS_CREDENTIALS_FILE}")
+                logger.error("Google Sheets credentials file not found: %s", GOOGLE_SHEETS_CREDENTIALS_FILE)
                 return
             
             # Load credentials from service account file
@@ -43,16 +70,194 @@ class GoogleSheetsService:
                 scopes=scope
             )
             
-            # Build the service
-            self.service = build('sheets', 'v4', credentials=self.credentials)
+            # Build the service on one authorized HTTP object so keep-alive
+            # connections are reused across calls
+            authorized_http = AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self.service = build('sheets', 'v4', http=authorized_http,
+                                 cache_discovery=False, static_discovery=True)
             logger.info("Successfully authenticated with Google Sheets API")
             
         except Exception as e:
-            logger.error(f"Failed to authenticate with Google Sheets API: {e}")
+            logger.error("Failed to authenticate with Google Sheets API: %s", e)
             self.service = None
-    
 
-    
+    def _cache_appended_rows(self, sheet_name: str, rows: List[List[str]], result: Dict[str, Any]):
+        """Record the row numbers of freshly appended rows in the row index cache."""
+        updated_range = result.get('updates', {}).get('updatedRange', '')
+        match = re.search(r'![A-Z]+(\d+)', updated_range)
+        if not match:
+            return
+
+        first_row = int(match.group(1))
+        for offset, row in enumerate(rows):
+            if row and row[0]:
+                self._row_index[(sheet_name, row[0])] = first_row + offset
+
+    def _get_sheet_id(self, sheet_name: str) -> Optional[int]:
+        """Get the numeric sheet id for a sheet title, fetching the list once."""
+        if not self._sheet_ids:
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields='sheets/properties(sheetId,title)'
+            )
+            result = execute_with_retry(request)
+            for sheet in result.get('sheets', []):
+                properties = sheet.get('properties', {})
+                self._sheet_ids[properties.get('title')] = properties.get('sheetId')
+
+        return self._sheet_ids.get(sheet_name)
+
+    def _tag_appended_rows(self, structure, rows: List[List[str]], result: Dict[str, Any]):
+        """
+        Attach developer metadata keyed by record id to freshly appended rows.
+
+        Tagged rows can later be located with a developerMetadata search
+        instead of reading the id column, so lookups stay O(1) on the wire
+        even when the in-process row index has been lost. Best effort: a
+        failure here just means lookups fall back to the column scan.
+        """
+        updated_range = result.get('updates', {}).get('updatedRange', '')
+        match = re.search(r'![A-Z]+(\d+)', updated_range)
+        if not match:
+            return
+
+        try:
+            sheet_id = self._get_sheet_id(structure.name)
+            if sheet_id is None:
+                return
+
+            first_row = int(match.group(1))
+            id_field = structure.fields[0].name
+            requests = []
+            for offset, row in enumerate(rows):
+                if not row or not row[0]:
+                    continue
+                row_index = first_row + offset
+                requests.append({
+                    'createDeveloperMetadata': {
+                        'developerMetadata': {
+                            'metadataKey': id_field,
+                            'metadataValue': row[0],
+                            'location': {
+                                'dimensionRange': {
+                                    'sheetId': sheet_id,
+                                    'dimension': 'ROWS',
+                                    'startIndex': row_index - 1,
+                                    'endIndex': row_index
+                                }
+                            },
+                            'visibility': 'DOCUMENT'
+                        }
+                    }
+                })
+
+            if requests:
+                self._rate_limiter.acquire()
+                request = self.service.spreadsheets().batchUpdate(
+                    spreadsheetId=self.spreadsheet_id,
+                    body={'requests': requests},
+                    fields='spreadsheetId'
+                )
+                execute_with_retry(request)
+        except Exception as e:
+            logger.warning("Could not tag appended rows with metadata: %s", e)
+
+    def _search_row_metadata(self, structure, target: str) -> Optional[int]:
+        """Look up a record's row via developer metadata; None on any miss."""
+        try:
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().developerMetadata().search(
+                spreadsheetId=self.spreadsheet_id,
+                body={'dataFilters': [{
+                    'developerMetadataLookup': {
+                        'metadataKey': structure.fields[0].name,
+                        'metadataValue': target
+                    }
+                }]}
+            )
+            result = execute_with_retry(request)
+
+            for matched in result.get('matchedDeveloperMetadata', []):
+                location = matched.get('developerMetadata', {}).get('location', {})
+                dimension_range = location.get('dimensionRange', {})
+                if dimension_range.get('sheetId') == self._get_sheet_id(structure.name):
+                    return dimension_range['startIndex'] + 1
+            return None
+        except Exception as e:
+            logger.warning("Developer metadata search failed, falling back to scan: %s", e)
+            return None
+
+    def _cached_values_get(self, range_name: str, **kwargs) -> Dict[str, Any]:
+        """Fetch a value range, serving repeats from the short-lived read cache."""
+        # The same range read with ROWS vs COLUMNS yields different payloads,
+        # so the orientation has to be part of the key
+        key = (self.spreadsheet_id, range_name, kwargs.get('majorDimension', 'ROWS'))
+        with self._cache_lock:
+            cached = self._read_cache.get(key)
+        if cached is not None:
+            return cached
+
+        self._rate_limiter.acquire()
+        request = self.service.spreadsheets().values().get(
+            spreadsheetId=self.spreadsheet_id,
+            range=range_name,
+            fields='values',
+            **kwargs
+        )
+        result = execute_with_retry(request)
+
+        with self._cache_lock:
+            self._read_cache[key] = result
+        return result
+
+    def _invalidate_sheet_reads(self, sheet_name: str):
+        """Drop cached reads for a sheet after it has been written."""
+        prefix = f"{sheet_name}!"
+        with self._cache_lock:
+            stale = [key for key in self._read_cache if key[1].startswith(prefix)]
+            for key in stale:
+                del self._read_cache[key]
+
+    def _find_row_index(self, structure, record_id: str) -> Optional[int]:
+        """
+        Locate the 1-based row number for a record id, reading only column A.
+
+        Uses the in-process row index when possible; on a miss, fetches just
+        the id column instead of the whole sheet.
+        """
+        cache_key = (structure.name, str(record_id))
+        row_index = self._row_index.get(cache_key)
+        if row_index is not None:
+            return row_index
+
+        # Rows tagged at insert time can be found with a metadata search,
+        # which returns one row instead of the whole id column
+        target = str(record_id)
+        row_index = self._search_row_metadata(structure, target)
+        if row_index is not None:
+            self._row_index[cache_key] = row_index
+            return row_index
+
+        result = self._cached_values_get(f"{structure.name}!A:A", majorDimension='COLUMNS')
+
+        columns = result.get('values', [])
+        ids = columns[0] if columns else []
+
+        # The API always returns strings, so one str() on the target is the
+        # only conversion needed; next() keeps the scan in C
+        row_index = next(
+            (i + 1 for i, value in enumerate(ids) if value == target),  # 1-based
+            None
+        )
+
+        if row_index is None:
+            return None
+
+        self._row_index[cache_key] = row_index
+        return row_index
+
+
     def insert_record(self, sheet_type: SheetType, data: Dict[str, Any]) -> bool:
         """
         Insert a new record into the specified sheet type.
@@ -71,7 +276,7 @@ class GoogleSheetsService:
         # Get sheet structure
         structure = get_sheet_structure(sheet_type)
         if not structure:
-            logger.error(f"Unknown sheet type: {sheet_type}")
+            logger.error("Unknown sheet type: %s", sheet_type)
             return False
         
         try:
@@ -82,7 +287,7 @@ class GoogleSheetsService:
                 row_data.append(str(value) if value is not None else "")
             
             # Define the range (append to the end of the sheet)
-            range_name = f"{structure.name}!A:{structure.fields[-1].column}"
+            range_name = get_full_range(sheet_type)
             
             # Prepare the request body
             body = {
@@ -90,24 +295,97 @@ class GoogleSheetsService:
             }
             
             # Append the data
-            result = self.service.spreadsheets().values().append(
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().values().append(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption='RAW',
                 insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            logger.info(f"Successfully inserted record in {structure.name}")
+                body=body,
+                fields='updates/updatedRange'
+            )
+            result = execute_with_retry(request)
+
+            self._cache_appended_rows(structure.name, [row_data], result)
+            self._tag_appended_rows(structure, [row_data], result)
+            self._invalidate_sheet_reads(structure.name)
+            logger.info("Successfully inserted record in %s", structure.name)
             return True
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while inserting record: {e}")
+            logger.error("HTTP error occurred while inserting record: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Error inserting record: {e}")
+            logger.error("Error inserting record: %s", e)
             return False
     
+    def insert_records(self, sheet_type: SheetType, records: List[Dict[str, Any]]) -> bool:
+        """
+        Insert multiple records into the specified sheet type with one API call.
+
+        Args:
+            sheet_type: The type of sheet to insert into
+            records: List of records to insert
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not records:
+            return True
+
+        if not self.service or not self.spreadsheet_id:
+            logger.warning("Google Sheets service not available. Skipping record insertion.")
+            return False
+
+        # Get sheet structure
+        structure = get_sheet_structure(sheet_type)
+        if not structure:
+            logger.error("Unknown sheet type: %s", sheet_type)
+            return False
+
+        try:
+            # Prepare all rows in correct column order
+            rows = []
+            for data in records:
+                row_data = []
+                for field in structure.fields:
+                    value = data.get(field.name, "")
+                    row_data.append(str(value) if value is not None else "")
+                rows.append(row_data)
+
+            # Define the range (append to the end of the sheet)
+            range_name = get_full_range(sheet_type)
+
+            # Append all rows in one request, chunking only oversized batches
+            for start in range(0, len(rows), MAX_ROWS_PER_APPEND):
+                chunk = rows[start:start + MAX_ROWS_PER_APPEND]
+                self._rate_limiter.acquire()
+                request = self.service.spreadsheets().values().append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=range_name,
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body={'values': chunk},
+                    fields='updates/updatedRange'
+                )
+                result = execute_with_retry(request)
+
+                self._cache_appended_rows(structure.name, chunk, result)
+                self._tag_appended_rows(structure, chunk, result)
+                # Invalidate per chunk so a failure partway through doesn't
+                # leave cached reads contradicting already-written rows
+                self._invalidate_sheet_reads(structure.name)
+
+            logger.info("Successfully inserted %s records in %s", len(rows), structure.name)
+            return True
+
+        except HttpError as e:
+            logger.error("HTTP error occurred while inserting records: %s", e)
+            return False
+        except Exception as e:
+            logger.error("Error inserting records: %s", e)
+            return False
+
     def update_record(self, sheet_type: SheetType, record_id: str, updates: Dict[str, Any]) -> bool:
         """
         Update a record in the specified sheet type.
@@ -127,68 +405,120 @@ class GoogleSheetsService:
         # Get sheet structure
         structure = get_sheet_structure(sheet_type)
         if not structure:
-            logger.error(f"Unknown sheet type: {sheet_type}")
+            logger.error("Unknown sheet type: %s", sheet_type)
             return False
         
         try:
-            # Find the row with the record_id
-            range_name = f"{structure.name}!A:{structure.fields[-1].column}"
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
-            
-            values = result.get('values', [])
-            if not values:
-                logger.warning("No data found in spreadsheet")
-                return False
-            
-            # Find the row with matching record_id
-            row_index = None
-            for i, row in enumerate(values):
-                if row and str(row[0]) == str(record_id):
-                    row_index = i + 1  # Sheets uses 1-based indexing
-                    break
-            
-            if row_index is None:
-                logger.warning(f"Record ID {record_id} not found in {structure.name}")
-                return False
-            
-            # Update each provided field
+            # Filter to known fields first so a no-op update returns before
+            # the row lookup costs an API read
+            valid_updates = {}
             for field_name, value in updates.items():
-                # Find the field definition
-                field_def = None
-                for field in structure.fields:
-                    if field.name == field_name:
-                        field_def = field
-                        break
-                
-                if field_def:
-                    range_name = f"{structure.name}!{field_def.column}{row_index}"
-                    body = {
-                        'values': [[str(value)]]
-                    }
-                    
-                    result = self.service.spreadsheets().values().update(
-                        spreadsheetId=self.spreadsheet_id,
-                        range=range_name,
-                        valueInputOption='RAW',
-                        body=body
-                    ).execute()
-                    
-                    logger.info(f"Successfully updated {field_name} for {record_id}: {value}")
+                if get_field(sheet_type, field_name):
+                    valid_updates[field_name] = value
                 else:
-                    logger.warning(f"Unknown field '{field_name}' provided for update")
-            
+                    logger.warning("Unknown field '%s' provided for update", field_name)
+
+            if not valid_updates:
+                return True
+
+            # Locate the row (cached index, or a column-A-only read)
+            cache_key = (structure.name, str(record_id))
+            row_index = self._find_row_index(structure, record_id)
+            if row_index is None:
+                logger.warning("Record ID %s not found in %s", record_id, structure.name)
+                return False
+
+            # Coalesce all provided fields into a single batchUpdate call,
+            # building ranges from the precomputed 'Sheet!Column' prefixes
+            prefixes = get_range_prefixes(sheet_type)
+            row_suffix = str(row_index)
+            data = [
+                {
+                    'range': prefixes[field_name] + row_suffix,
+                    'values': [[str(value)]]
+                }
+                for field_name, value in valid_updates.items()
+            ]
+
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={
+                    'valueInputOption': 'RAW',
+                    'data': data
+                },
+                fields='totalUpdatedCells'
+            )
+            execute_with_retry(request)
+
+            logger.info("Successfully updated %s fields for %s in %s", len(data), record_id, structure.name)
+
+            # Drop cached copies so the next read sees the new values
+            self._record_cache.pop(cache_key, None)
+            self._invalidate_sheet_reads(structure.name)
+
             return True
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while updating record: {e}")
+            logger.error("HTTP error occurred while updating record: %s", e)
             return False
         except Exception as e:
-            logger.error(f"Error updating record: {e}")
+            logger.error("Error updating record: %s", e)
             return False
     
+    def batch_write(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        Write several value ranges, possibly across sheets, in one API call.
+
+        Callers that would otherwise issue back-to-back writes (for example
+        an appointment insert plus a lead status update) can coalesce them
+        into a single batchUpdate round trip.
+
+        Args:
+            data: Value-range dicts of the form {'range': ..., 'values': ...}
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not data:
+            return True
+
+        if not self.service or not self.spreadsheet_id:
+            logger.warning("Google Sheets service not available. Skipping batch write.")
+            return False
+
+        try:
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={
+                    'valueInputOption': 'RAW',
+                    'data': data
+                },
+                fields='totalUpdatedCells'
+            )
+            execute_with_retry(request)
+
+            # Drop cached reads and records for every sheet the batch
+            # touched so follow-up lookups see the new values
+            touched = {entry.get('range', '').split('!')[0] for entry in data}
+            touched.discard('')
+            for sheet_name in touched:
+                self._invalidate_sheet_reads(sheet_name)
+                stale = [key for key in self._record_cache if key[0] == sheet_name]
+                for key in stale:
+                    self._record_cache.pop(key, None)
+
+            logger.info("Successfully wrote %s ranges in one batch", len(data))
+            return True
+
+        except HttpError as e:
+            logger.error("HTTP error occurred during batch write: %s", e)
+            return False
+        except Exception as e:
+            logger.error("Error during batch write: %s", e)
+            return False
+
     def get_record(self, sheet_type: SheetType, record_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a record from the specified sheet type.
@@ -207,44 +537,41 @@ class GoogleSheetsService:
         # Get sheet structure
         structure = get_sheet_structure(sheet_type)
         if not structure:
-            logger.error(f"Unknown sheet type: {sheet_type}")
+            logger.error("Unknown sheet type: %s", sheet_type)
             return None
         
         try:
-            range_name = f"{structure.name}!A:{structure.fields[-1].column}"
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
-            
+            # Serve repeat lookups for the same record from the cache
+            cache_key = (structure.name, str(record_id))
+            cached = self._record_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+            # Locate the row (cached index, or a column-A-only read), then
+            # fetch just that row instead of the whole sheet
+            row_index = self._find_row_index(structure, record_id)
+            if row_index is None:
+                return None
+
+            result = self._cached_values_get(a1_range(sheet_type, row_index))
+
             values = result.get('values', [])
             if not values:
                 return None
-            
-            # Find the row with matching record_id
-            for row in values:
-                if row and str(row[0]) == str(record_id):
-                    # Ensure the row has enough columns, pad with empty strings if needed
-                    while len(row) < len(structure.fields):
-                        row.append("")
-                    
-                    # Convert to dictionary using field names
-                    record = {}
-                    for i, field in enumerate(structure.fields):
-                        if i < len(row):
-                            record[field.name] = row[i]
-                        else:
-                            record[field.name] = ""
-                    
-                    return record
-            
-            return None
+
+            # Pad short rows in one step and zip straight into the field names
+            field_names = [field.name for field in structure.fields]
+            row = values[0]
+            record = dict(zip(field_names, row + [""] * (len(field_names) - len(row))))
+
+            self._record_cache[cache_key] = dict(record)
+            return record
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while getting record: {e}")
+            logger.error("HTTP error occurred while getting record: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error getting record: {e}")
+            logger.error("Error getting record: %s", e)
             return None
     
     def get_all_records(self, sheet_type: SheetType) -> List[Dict[str, Any]]:
@@ -264,49 +591,159 @@ class GoogleSheetsService:
         # Get sheet structure
         structure = get_sheet_structure(sheet_type)
         if not structure:
-            logger.error(f"Unknown sheet type: {sheet_type}")
+            logger.error("Unknown sheet type: %s", sheet_type)
             return []
         
         try:
-            range_name = f"{structure.name}!A:{structure.fields[-1].column}"
-            result = self.service.spreadsheets().values().get(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name
-            ).execute()
-            
+            range_name = get_full_range(sheet_type)
+            result = self._cached_values_get(range_name)
+
             values = result.get('values', [])
             if not values:
                 return []
             
-            records = []
-            # Skip the first row (header row) and process all data rows
-            for row in values[1:]:
-                if not row:
-                    continue
-                
-                # Ensure the row has enough columns, pad with empty strings if needed
-                while len(row) < len(structure.fields):
-                    row.append("")
-                
-                # Convert to dictionary using field names
-                record = {}
-                for i, field in enumerate(structure.fields):
-                    if i < len(row):
-                        record[field.name] = row[i]
-                    else:
-                        record[field.name] = ""
-                
-                records.append(record)
-            
-            logger.info(f"Successfully retrieved {len(records)} records from {structure.name}")
+            # Skip the first row (header row) and process all data rows,
+            # padding short rows in one step and zipping into field names
+            field_names = [field.name for field in structure.fields]
+            pad = [""] * len(field_names)
+            records = [
+                dict(zip(field_names, row + pad[len(row):]))
+                for row in values[1:] if row
+            ]
+
+            logger.info("Successfully retrieved %s records from %s", len(records), structure.name)
             return records
             
         except HttpError as e:
-            logger.error(f"HTTP error occurred while getting records: {e}")
+            logger.error("HTTP error occurred while getting records: %s", e)
             return []
         except Exception as e:
-            logger.error(f"Error getting records: {e}")
+            logger.error("Error getting records: %s", e)
             return []
 
-# Create a global instance
-goole_sheet_service = GoogleSheetsService()
+    def get_all_records_columns(self, sheet_type: SheetType) -> Dict[str, List[str]]:
+        """
+        Get all records from the specified sheet type in columnar form.
+
+        Unlike get_all_records, this returns one list per field instead of a
+        dict per row, so large sheets avoid a per-row hash table and the
+        values arrive column-wise straight from the API.
+
+        Args:
+            sheet_type: The type of sheet to get from
+
+        Returns:
+            Dict mapping each field name to its column of values (header
+            row excluded, columns padded to equal length)
+        """
+        if not self.service or not self.spreadsheet_id:
+            logger.warning("Google Sheets service not available. Cannot get records.")
+            return {}
+
+        # Get sheet structure
+        structure = get_sheet_structure(sheet_type)
+        if not structure:
+            logger.error("Unknown sheet type: %s", sheet_type)
+            return {}
+
+        try:
+            range_name = get_full_range(sheet_type)
+            result = self._cached_values_get(range_name, majorDimension='COLUMNS')
+
+            columns = result.get('values', [])
+            if not columns:
+                return {field.name: [] for field in structure.fields}
+
+            # Drop the header cell from each column and pad trailing columns
+            # the API truncated so every list has the same length
+            num_rows = max(len(column) for column in columns) - 1
+            data = {}
+            for field, column in zip(structure.fields, columns + [[]] * len(structure.fields)):
+                values = column[1:]
+                data[field.name] = values + [""] * (num_rows - len(values))
+
+            logger.info("Successfully retrieved %s rows from %s", num_rows, structure.name)
+            return data
+
+        except HttpError as e:
+            logger.error("HTTP error occurred while getting records: %s", e)
+            return {}
+        except Exception as e:
+            logger.error("Error getting records: %s", e)
+            return {}
+
+    def batch_get_records(self, sheet_types: List[SheetType]) -> Dict[SheetType, List[Dict[str, Any]]]:
+        """
+        Get all records from several sheet types with a single API call.
+
+        Args:
+            sheet_types: The sheet types to read
+
+        Returns:
+            Dict mapping each sheet type to its list of records
+        """
+        if not self.service or not self.spreadsheet_id:
+            logger.warning("Google Sheets service not available. Cannot get records.")
+            return {sheet_type: [] for sheet_type in sheet_types}
+
+        # Resolve ranges up front, skipping unknown sheet types
+        valid_types = []
+        ranges = []
+        for sheet_type in sheet_types:
+            if not get_sheet_structure(sheet_type):
+                logger.error("Unknown sheet type: %s", sheet_type)
+                continue
+            valid_types.append(sheet_type)
+            ranges.append(get_full_range(sheet_type))
+
+        records_by_type = {sheet_type: [] for sheet_type in valid_types}
+        if not ranges:
+            return records_by_type
+
+        try:
+            # One batchGet covers every requested sheet
+            self._rate_limiter.acquire()
+            request = self.service.spreadsheets().values().batchGet(
+                spreadsheetId=self.spreadsheet_id,
+                ranges=ranges,
+                majorDimension='ROWS',
+                fields='valueRanges/values'
+            )
+            result = execute_with_retry(request)
+
+            value_ranges = result.get('valueRanges', [])
+            for sheet_type, value_range in zip(valid_types, value_ranges):
+                values = value_range.get('values', [])
+                if not values:
+                    continue
+
+                # Same row handling as get_all_records: skip the header row,
+                # pad short rows and zip into field names
+                structure = get_sheet_structure(sheet_type)
+                field_names = [field.name for field in structure.fields]
+                pad = [""] * len(field_names)
+                records_by_type[sheet_type] = [
+                    dict(zip(field_names, row + pad[len(row):]))
+                    for row in values[1:] if row
+                ]
+
+            logger.info("Successfully batch-retrieved records from %s sheets", len(valid_types))
+            return records_by_type
+
+        except HttpError as e:
+            logger.error("HTTP error occurred while batch-getting records: %s", e)
+            return records_by_type
+        except Exception as e:
+            logger.error("Error batch-getting records: %s", e)
+            return records_by_type
+
+# Lazily constructed shared instance so importing this module does no
+# credential reads or network I/O
+_instance: Optional[GoogleSheetsService] = None
+
+def get_sheet_service() -> GoogleSheetsService:
+    """Get the shared GoogleSheetsService, constructing it on first use."""
+    global _instance
+    if _instance is None:
+        _instance = GoogleSheetsService()
+    return _instance
@@ -6,6 +6,8 @@ Each sheet type has its own field structure and validation rules.
 from typing import Dict, List
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 
 class SheetType(Enum):
     """Enumeration of different sheet types."""
@@ -100,16 +102,67 @@ SHEET_STRUCTURES = {
     )
 }
 
+# Precomputed per-sheet metadata so hot paths don't rebuild range strings or
+# linearly search field lists on every call
+FULL_RANGES = {
+    sheet_type: f"{structure.name}!A:{structure.fields[-1].column}"
+    for sheet_type, structure in SHEET_STRUCTURES.items()
+}
+
+FIELDS_BY_NAME = {
+    sheet_type: {field.name: field for field in structure.fields}
+    for sheet_type, structure in SHEET_STRUCTURES.items()
+}
+
+# Read-only views so hot paths share one mapping instead of rebuilding a
+# dict per call, without risking accidental mutation of shared state
+FIELD_MAPPINGS = {
+    sheet_type: MappingProxyType({field.name: field.column for field in structure.fields})
+    for sheet_type, structure in SHEET_STRUCTURES.items()
+}
+
+COLUMN_TO_FIELD = {
+    sheet_type: MappingProxyType({field.column: field.name for field in structure.fields})
+    for sheet_type, structure in SHEET_STRUCTURES.items()
+}
+
+RANGE_PREFIXES = {
+    sheet_type: {
+        field.name: f"{structure.name}!{field.column}"
+        for field in structure.fields
+    }
+    for sheet_type, structure in SHEET_STRUCTURES.items()
+}
+
 def get_sheet_structure(sheet_type: SheetType) -> SheetStructure:
     """Get the structure definition for a specific sheet type."""
     return SHEET_STRUCTURES.get(sheet_type)
 
+def get_full_range(sheet_type: SheetType) -> str:
+    """Get the precomputed A1 range covering all columns of a sheet type."""
+    return FULL_RANGES.get(sheet_type)
+
+def get_field(sheet_type: SheetType, field_name: str) -> FieldDefinition:
+    """Get a field definition by name for a sheet type (O(1) lookup)."""
+    return FIELDS_BY_NAME.get(sheet_type, {}).get(field_name)
+
+@lru_cache(maxsize=4096)
+def a1_range(sheet_type: SheetType, row: int) -> str:
+    """Get the A1 range for one full row of a sheet type, memoized per row."""
+    structure = SHEET_STRUCTURES[sheet_type]
+    last_column = structure.fields[-1].column
+    return f"{structure.name}!A{row}:{last_column}{row}"
+
+def get_range_prefixes(sheet_type: SheetType) -> Dict[str, str]:
+    """Get the precomputed 'Sheet!Column' prefix for each field of a sheet type."""
+    return RANGE_PREFIXES.get(sheet_type, {})
+
 def get_field_mapping(sheet_type: SheetType) -> Dict[str, str]:
-    """Get the field to column mapping for a sheet type."""
-    structure = get_sheet_structure(sheet_type)
-    if not structure:
-        return {}
-    
-    return {field.name: field.column for field in structure.fields}
+    """Get the precomputed field to column mapping for a sheet type."""
+    return FIELD_MAPPINGS.get(sheet_type, {})
+
+def get_column_mapping(sheet_type: SheetType) -> Dict[str, str]:
+    """Get the precomputed column to field mapping for a sheet type."""
+    return COLUMN_TO_FIELD.get(sheet_type, {})
 
 